@@ -12,13 +12,21 @@ import random
 import time
 from dataclasses import dataclass
 
-from terminaltexteffects import Color, Coord, EffectCharacter, Gradient, easing
+from terminaltexteffects import Color, Coord, EffectCharacter, EventHandler, Gradient, easing
 from terminaltexteffects.engine.base_config import BaseConfig
 from terminaltexteffects.engine.base_effect import BaseEffect, BaseEffectIterator
 from terminaltexteffects.utils import argutils
 from terminaltexteffects.utils.argutils import ArgSpec, ParserSpec
 from terminaltexteffects.utils.graphics import ColorPair
 
+# Sway direction indexed by waypoint parity: even waypoints sway right, odd waypoints sway left
+_SWAY_SIGNS = (1, -1)
+
+# Landed text colors, alternating by row
+_WHITE = Color("ffffff")
+_GREEN = Color("33cc33")  # Christmas green
+_RED = Color("ff6666")  # Christmas red
+
 
 def get_effect_resources() -> tuple[str, type[BaseEffect], type[BaseConfig]]:
     """Get the command, effect class, and configuration class for the effect.
@@ -30,6 +38,28 @@ def get_effect_resources() -> tuple[str, type[BaseEffect], type[BaseConfig]]:
     return "moresnow", MoreSnow, MoreSnowConfig
 
 
+def _sway_columns(start_column: int, num_waypoints: int, left: int, right: int) -> list[int]:
+    """Generate the sway columns for a falling snowflake's intermediate waypoints.
+
+    Args:
+        start_column (int): Column the snowflake starts falling from.
+        num_waypoints (int): Number of sway waypoints to generate.
+        left (int): Leftmost canvas column.
+        right (int): Rightmost canvas column.
+
+    Returns:
+        list[int]: Sway columns clamped to the canvas, one per waypoint.
+
+    """
+    rand_int = random.randint
+    columns: list[int] = []
+    current_column = start_column
+    for i in range(1, num_waypoints + 1):
+        current_column += _SWAY_SIGNS[i & 1] * rand_int(1, 3)
+        columns.append(max(left, min(right, current_column)))
+    return columns
+
+
 @dataclass
 class MoreSnowConfig(BaseConfig):
     """Configuration for the MoreSnow effect.
@@ -128,178 +158,255 @@ class MoreSnowIterator(BaseEffectIterator[MoreSnowConfig]):
 
         """
         super().__init__(effect)
+        # Cache canvas bounds and config values used on every spawn
+        self._canvas_left: int = self.terminal.canvas.left
+        self._canvas_right: int = self.terminal.canvas.right
+        self._canvas_top: int = self.terminal.canvas.top
+        self._canvas_bottom: int = self.terminal.canvas.bottom
+        self._symbols: tuple[str, ...] = tuple(self.config.snow_symbols)
+        self._colors: tuple[Color, ...] = tuple(self.config.snow_colors)
+        self._speed: float = self.config.movement_speed
+        self._columns: range = range(self._canvas_left, self._canvas_right + 1)
+        # Sway rows for background snow only depend on the number of sways, so precompute them
+        background_fall_distance = self._canvas_top - self._canvas_bottom
+        self._sway_row_tables: dict[int, tuple[int, ...]] = {
+            num_sways: tuple(
+                self._canvas_top - int(background_fall_distance * (i / num_sways)) for i in range(1, num_sways)
+            )
+            for num_sways in (2, 3, 4)
+        }
         self.pending_chars: list[EffectCharacter] = []
-        self.background_snow: list[EffectCharacter] = []
-        self.bottom_pile_height: dict[int, int] = {}
+        # Only still-falling background snow is tracked; stacked flakes stay in place on the canvas
+        self._falling_snow: list[EffectCharacter] = []
+        # Pile height per canvas column, indexed by column - canvas left
+        self.bottom_pile_height: list[int] = [0] * len(self._columns)
+        # Number of columns whose pile can still grow
+        self._open_col_count: int = len(self._columns)
+        # Set once piles stop growing (all full, or fadeout started); landed snow is then only hidden
+        self._pile_frozen: bool = False
         self.text_spawn_delay: int = 0
         self.background_spawn_delay: int = 0
         self.text_complete: bool = False
+        self._text_chars_in_flight: int = 0
         self.fadeout_counter: int = 0
         self.spawn_stopped: bool = False
+        self._all_text_chars: tuple[EffectCharacter, ...] = ()
+        self._snow_pool: list[EffectCharacter] = []
+        self._snow_color_pairs: dict[Color, ColorPair] = {color: ColorPair(fg=color) for color in self._colors}
         self.build()
 
-    def is_outline_character(self, character: EffectCharacter) -> bool:
-        """Check if a character is on the outline (has at least one space neighbor).
-
-        Args:
-            character: The character to check.
-
-        Returns:
-            bool: True if character is on the outline, False if interior.
-        """
-        coord = character.input_coord
-        # Check all 4 neighbors (up, down, left, right)
-        neighbors = [
-            Coord(coord.column, coord.row - 1),  # up
-            Coord(coord.column, coord.row + 1),  # down
-            Coord(coord.column - 1, coord.row),  # left
-            Coord(coord.column + 1, coord.row),  # right
-        ]
-
-        # If any neighbor is a space (or doesn't exist), this is an outline character
-        all_chars = {char.input_coord: char for char in self.terminal.get_characters()}
-        for neighbor_coord in neighbors:
-            if neighbor_coord not in all_chars:
-                return True  # Edge of text = outline
-        return False
-
     def build(self) -> None:
         """Build the initial state of the effect."""
-        # Get all characters sorted by position (top to bottom, left to right)
-        all_chars = sorted(self.terminal.get_characters(), key=lambda c: (c.input_coord.row, c.input_coord.column))
-
-        # Create index mapping for alternating colors
-        char_to_index = {char: idx for idx, char in enumerate(all_chars)}
+        # Materialize the text characters once and reuse them for the rest of the effect
+        self._all_text_chars = tuple(self.terminal.get_characters())
+
+        canvas_left = self._canvas_left
+        canvas_right = self._canvas_right
+        canvas_top = self._canvas_top
+        symbols = self._symbols
+        colors = self._colors
+        speed = self._speed
+        rand_int = random.randint
+        rand_choice = random.choice
+        rand_uni = random.uniform
+        snow_color_pairs = self._snow_color_pairs
+        # Snow appearance while falling - exclude "." for text characters
+        text_snow_symbols = tuple(s for s in symbols if s != ".") or symbols
+        # Sway rows for text snow depend on the target row, cache them per (row, num_sways)
+        text_sway_rows: dict[tuple[int, int], tuple[int, ...]] = {}
+        landed_callback = EventHandler.Callback(self._text_char_landed)
+        # Landed colors alternate by row: white, green, red, white, green, red...
+        landed_color_pairs = (
+            ColorPair(fg=_WHITE),
+            ColorPair(fg=_GREEN),
+            ColorPair(fg=_RED),
+        )
 
         # Setup text characters - falling snow effect
-        for character in self.terminal.get_characters():
+        for character in self._all_text_chars:
             character.layer = 2  # In front of background snow
 
-            # Snow appearance while falling - exclude "." for text characters
-            text_snow_symbols = [s for s in self.config.snow_symbols if s != "."]
-            snow_symbol = random.choice(text_snow_symbols) if text_snow_symbols else random.choice(self.config.snow_symbols)
-            snow_color = random.choice(self.config.snow_colors)
+            snow_symbol = rand_choice(text_snow_symbols)
+            snow_color = rand_choice(colors)
             falling_scene = character.animation.new_scene()
-            falling_scene.add_frame(snow_symbol, 1, colors=ColorPair(fg=snow_color))
+            falling_scene.add_frame(snow_symbol, 1, colors=snow_color_pairs[snow_color])
 
             # Landed appearance - horizontal lines of white, green, red
-            landed_scene = character.animation.new_scene()
-            # Alternate colors by row: white, green, red, white, green, red...
-            row_mod = character.input_coord.row % 3
-            if row_mod == 0:
-                landed_color = Color("ffffff")  # White
-            elif row_mod == 1:
-                landed_color = Color("33cc33")  # Christmas green
-            else:  # row_mod == 2
-                landed_color = Color("ff6666")  # Christmas red
-            landed_scene.add_frame(character.input_symbol, 1, colors=ColorPair(fg=landed_color))
+            landed_scene = character.animation.new_scene(scene_id="landed")
+            landed_color_pair = landed_color_pairs[character.input_coord.row % 3]
+            landed_scene.add_frame(character.input_symbol, 1, colors=landed_color_pair)
 
             character.animation.activate_scene(falling_scene)
 
             # Start above the canvas and fall to input position
-            character.motion.set_coordinate(Coord(character.input_coord.column, self.terminal.canvas.top))
+            character.motion.set_coordinate(Coord(character.input_coord.column, canvas_top))
 
             # Create falling path with swaying
-            snowflake_speed = self.config.movement_speed * random.uniform(0.7, 1.3)
+            snowflake_speed = speed * rand_uni(0.7, 1.3)
             fall_path = character.motion.new_path(speed=snowflake_speed, ease=easing.in_out_sine)
 
             # Add some sway waypoints
-            num_sways = random.randint(2, 4)
-            fall_distance = self.terminal.canvas.top - character.input_coord.row
-            current_column = character.input_coord.column
-
-            for i in range(1, num_sways):
-                progress = i / num_sways
-                sway_row = self.terminal.canvas.top - int(fall_distance * progress)
-                sway_direction = 1 if i % 2 == 0 else -1
-                sway_amount = random.randint(1, 3)
-                current_column = current_column + (sway_direction * sway_amount)
-                sway_column = max(self.terminal.canvas.left, min(self.terminal.canvas.right, current_column))
+            num_sways = rand_int(2, 4)
+            sway_rows = text_sway_rows.get((character.input_coord.row, num_sways))
+            if sway_rows is None:
+                fall_distance = canvas_top - character.input_coord.row
+                sway_rows = tuple(canvas_top - int(fall_distance * (i / num_sways)) for i in range(1, num_sways))
+                text_sway_rows[(character.input_coord.row, num_sways)] = sway_rows
+            sway_columns = _sway_columns(character.input_coord.column, len(sway_rows), canvas_left, canvas_right)
+            for sway_column, sway_row in zip(sway_columns, sway_rows):
                 fall_path.new_waypoint(Coord(sway_column, sway_row))
 
             # Final waypoint at input position
             fall_path.new_waypoint(character.input_coord)
 
-            # Switch to landed color when path completes
+            # Switch to landed color and track outstanding text paths with one shared handler
             character.event_handler.register_event(
                 character.event_handler.Event.PATH_COMPLETE,
                 fall_path,
-                character.event_handler.Action.ACTIVATE_SCENE,
-                landed_scene,
+                character.event_handler.Action.CALLBACK,
+                landed_callback,
             )
 
             character.motion.activate_path(fall_path)
+            self._text_chars_in_flight += 1
             self.pending_chars.append(character)
 
-        # Sort by row (bottom to top) so bottom letters fill first
-        self.pending_chars.sort(key=lambda c: c.input_coord.row, reverse=True)
+        # Shuffle once so characters can be released in random order by popping from the end
+        random.shuffle(self.pending_chars)
+
+    def _text_char_landed(self, character: EffectCharacter) -> None:
+        """Show a text character's landed scene and record that it finished its fall path.
+
+        Args:
+            character: The character that landed.
+        """
+        character.animation.activate_scene(character.animation.query_scene("landed"))
+        self._text_chars_in_flight -= 1
+
+    def spawn_background_snowflakes(self, count: int, speed_multiplier: float = 1.0) -> None:
+        """Spawn a burst of background snowflakes that fall to the bottom.
 
-    def spawn_background_snowflake(self, speed_multiplier: float = 1.0) -> None:
-        """Spawn a background snowflake that falls to the bottom.
+        Columns, symbols, colors, sway counts and speed factors for the whole burst are drawn up
+        front; the per-flake loop still draws the sway offsets for each waypoint.
 
         Args:
+            count: Number of snowflakes to spawn.
             speed_multiplier: Multiplier for the falling speed (default 1.0).
         """
-        snow_col = random.randint(self.terminal.canvas.left, self.terminal.canvas.right)
-        snow_char = self.terminal.add_character(" ", Coord(snow_col, self.terminal.canvas.top))
-        snow_char.layer = 1  # Behind text characters
-
-        # Snow appearance
-        snow_symbol = random.choice(self.config.snow_symbols)
-        snow_color = random.choice(self.config.snow_colors)
-        snow_scene = snow_char.animation.new_scene()
-        snow_scene.add_frame(snow_symbol, 1, colors=ColorPair(fg=snow_color))
-        snow_char.animation.activate_scene(snow_scene)
-
-        # Set starting position at top
-        snow_char.motion.set_coordinate(Coord(snow_col, self.terminal.canvas.top))
-
-        # Create falling path with swaying - using same logic as text snow
-        snowflake_speed = self.config.movement_speed * random.uniform(0.7, 1.3) * speed_multiplier
-        fall_path = snow_char.motion.new_path(speed=snowflake_speed, ease=easing.in_out_sine)
-
-        # Add sway waypoints - use subtraction like text snow does
-        num_sways = random.randint(2, 4)
-        fall_distance = self.terminal.canvas.top - self.terminal.canvas.bottom
-        current_column = snow_col
-
-        for i in range(1, num_sways):
-            progress = i / num_sways
-            sway_row = self.terminal.canvas.top - int(fall_distance * progress)
-            sway_direction = 1 if i % 2 == 0 else -1
-            sway_amount = random.randint(1, 3)
-            current_column = current_column + (sway_direction * sway_amount)
-            sway_column = max(self.terminal.canvas.left, min(self.terminal.canvas.right, current_column))
-            fall_path.new_waypoint(Coord(sway_column, sway_row))
-
-        # Final waypoint at bottom
-        final_column = max(self.terminal.canvas.left, min(self.terminal.canvas.right, current_column))
-        fall_path.new_waypoint(Coord(final_column, self.terminal.canvas.bottom))
-
-        snow_char.motion.activate_path(fall_path)
-        self.terminal.set_character_visibility(snow_char, is_visible=True)
-        self.active_characters.add(snow_char)
-        self.background_snow.append(snow_char)
+        canvas_left = self._canvas_left
+        canvas_right = self._canvas_right
+        canvas_top = self._canvas_top
+        canvas_bottom = self._canvas_bottom
+        snow_pool = self._snow_pool
+        snow_color_pairs = self._snow_color_pairs
+        sway_row_tables = self._sway_row_tables
+        base_speed = self._speed * speed_multiplier
+        add_character = self.terminal.add_character
+        set_visibility = self.terminal.set_character_visibility
+        activate_character = self.active_characters.add
+        track_falling = self._falling_snow.append
+
+        # Bias spawns away from full piles by re-rolling a full column once, keeping the snowfall spread
+        # across the whole canvas. Once piles are frozen nothing stacks, so spawn uniformly.
+        canvas_columns = self._columns
+        snow_cols = random.choices(canvas_columns, k=count)
+        if not self._pile_frozen:
+            pile_heights = self.bottom_pile_height
+            rand_choice = random.choice
+            snow_cols = [
+                col if pile_heights[col - canvas_left] < 5 else rand_choice(canvas_columns) for col in snow_cols
+            ]
+        snow_symbols = random.choices(self._symbols, k=count)
+        snow_colors = random.choices(self._colors, k=count)
+        sway_counts = random.choices((2, 3, 4), k=count)
+        rand_uni = random.uniform
+        speed_factors = [rand_uni(0.7, 1.3) for _ in range(count)]
+
+        for snow_col, snow_symbol, snow_color, num_sways, speed_factor in zip(
+            snow_cols,
+            snow_symbols,
+            snow_colors,
+            sway_counts,
+            speed_factors,
+        ):
+            if snow_pool:
+                # Recycle a snowflake whose pile was full instead of allocating a new character
+                snow_char = snow_pool.pop()
+                snow_char.motion.paths.clear()
+            else:
+                snow_char = add_character(" ", Coord(snow_col, canvas_top))
+                snow_char.layer = 1  # Behind text characters
+
+            # Snow appearance - reuse the scene id so recycled snowflakes replace their previous scene
+            snow_scene = snow_char.animation.new_scene(scene_id="snow")
+            snow_scene.add_frame(snow_symbol, 1, colors=snow_color_pairs[snow_color])
+            snow_char.animation.activate_scene(snow_scene)
+
+            # Set starting position at top
+            snow_char.motion.set_coordinate(Coord(snow_col, canvas_top))
+
+            # Create falling path with swaying - using same logic as text snow
+            snowflake_speed = base_speed * speed_factor
+            fall_path = snow_char.motion.new_path(speed=snowflake_speed, ease=easing.in_out_sine)
+
+            # Add sway waypoints - use subtraction like text snow does
+            sway_rows = sway_row_tables[num_sways]
+            sway_columns = _sway_columns(snow_col, len(sway_rows), canvas_left, canvas_right)
+            new_waypoint = fall_path.new_waypoint
+            for sway_column, sway_row in zip(sway_columns, sway_rows):
+                new_waypoint(Coord(sway_column, sway_row))
+
+            # Final waypoint at bottom, below the last sway
+            new_waypoint(Coord(sway_columns[-1], canvas_bottom))
+
+            snow_char.motion.activate_path(fall_path)
+            set_visibility(snow_char, is_visible=True)
+            activate_character(snow_char)
+            track_falling(snow_char)
+
+    def _close_column(self) -> None:
+        """Record that a column's pile is full and freeze the piles once none can grow."""
+        self._open_col_count -= 1
+        if not self._open_col_count:
+            self._pile_frozen = True
 
     def check_background_snow_landing(self) -> None:
         """Check if background snow has landed and stack it."""
-        for snow in list(self.background_snow):
-            if not snow.motion.active_path:
-                snow_coord = snow.motion.current_coord
-                landing_column = snow_coord.column
-
-                if landing_column not in self.bottom_pile_height:
-                    self.bottom_pile_height[landing_column] = 0
-
-                # Stack snow at bottom (max height 5) - subtract to stack upward
-                if self.bottom_pile_height[landing_column] < 5:
-                    stacked_row = self.terminal.canvas.bottom - self.bottom_pile_height[landing_column]
-                    snow.motion.set_coordinate(Coord(landing_column, stacked_row))
-                    self.bottom_pile_height[landing_column] += 1
+        # Collect still-falling snow in a fresh list rather than copying and removing from the current one
+        still_falling: list[EffectCharacter] = []
+        if self._pile_frozen:
+            # Piles are no longer growing, landed snow is only hidden and pooled
+            for snow in self._falling_snow:
+                if snow.motion.active_path:
+                    still_falling.append(snow)
                 else:
-                    # Pile is full, remove this snowflake
                     self.terminal.set_character_visibility(snow, is_visible=False)
-                    self.background_snow.remove(snow)
+                    self._snow_pool.append(snow)
+            self._falling_snow = still_falling
+            return
+
+        for snow in self._falling_snow:
+            if snow.motion.active_path:
+                still_falling.append(snow)
+                continue
+
+            snow_coord = snow.motion.current_coord
+            landing_column = snow_coord.column
+            pile_index = landing_column - self._canvas_left
+
+            # Stack snow at bottom (max height 5) - canvas rows increase upward from the bottom row
+            pile_height = self.bottom_pile_height[pile_index]
+            if pile_height < 5:
+                stacked_row = self._canvas_bottom + pile_height
+                snow.motion.set_coordinate(Coord(landing_column, stacked_row))
+                self.bottom_pile_height[pile_index] = pile_height + 1
+                if pile_height + 1 == 5:
+                    self._close_column()
+            else:
+                # Pile is full, hide this snowflake and return it to the pool
+                self.terminal.set_character_visibility(snow, is_visible=False)
+                self._snow_pool.append(snow)
+        self._falling_snow = still_falling
 
     def __next__(self) -> str:
         """Return the next frame in the animation."""
@@ -307,36 +414,30 @@ class MoreSnowIterator(BaseEffectIterator[MoreSnowConfig]):
         if self.pending_chars:
             if self.text_spawn_delay <= 0:
                 # Release only 1 character at a time, less frequently
-                if self.pending_chars:
-                    next_character = self.pending_chars.pop(random.randint(0, len(self.pending_chars) - 1))
-                    self.terminal.set_character_visibility(next_character, is_visible=True)
-                    self.active_characters.add(next_character)
+                next_character = self.pending_chars.pop()
+                self.terminal.set_character_visibility(next_character, is_visible=True)
+                self.active_characters.add(next_character)
                 self.text_spawn_delay = 1  # Delay between text snow
             else:
                 self.text_spawn_delay -= 1
         elif not self.text_complete:
             # Check if all text characters have landed (completed their paths and turned red)
-            all_text_landed = not self.pending_chars
-            if all_text_landed:
-                # Check if any text characters still have active paths
-                for char in self.terminal.get_characters():
-                    if char.motion.active_path:
-                        all_text_landed = False
-                        break
+            all_text_landed = self._text_chars_in_flight == 0
 
             if all_text_landed:
                 # Text completely filled with red, start fadeout
                 self.text_complete = True
-                # Speed up all existing background snow by creating new fast paths
-                for snow in self.background_snow:
-                    if snow.motion.active_path:
-                        # Get current position
-                        current_pos = snow.motion.current_coord
-                        # Create new fast path from current position to bottom
-                        fast_speed = self.config.movement_speed * 5.0  # Half as fast (5x instead of 10x)
-                        new_path = snow.motion.new_path(speed=fast_speed, ease=easing.in_quad)
-                        new_path.new_waypoint(Coord(current_pos.column, self.terminal.canvas.bottom))
-                        snow.motion.activate_path(new_path)
+                self._pile_frozen = True
+                # Speed up all existing background snow by rescaling their active paths in place
+                fast_speed = self._speed * 5.0  # Half as fast (5x instead of 10x)
+                for snow in self._falling_snow:
+                    fall_path = snow.motion.active_path
+                    if fall_path and fall_path.max_steps:
+                        # Keep the flake's progress along its path while shortening the remaining steps
+                        progress = fall_path.current_step / fall_path.max_steps
+                        fall_path.speed = fast_speed
+                        fall_path.max_steps = max(1, round(fall_path.total_distance / fast_speed))
+                        fall_path.current_step = min(fall_path.max_steps, round(progress * fall_path.max_steps))
 
         # Spawn background snowflakes with fadeout
         if not self.spawn_stopped:
@@ -346,18 +447,15 @@ class MoreSnowIterator(BaseEffectIterator[MoreSnowConfig]):
                     self.spawn_stopped = True
                 else:
                     if self.background_spawn_delay <= 0:
-                        # During fadeout: spawn many fast snowflakes
-                        for _ in range(random.randint(5, 10)):
-                            # Speed increase - 5x faster
-                            self.spawn_background_snowflake(speed_multiplier=5.0)
+                        # During fadeout: spawn many fast snowflakes, 5x faster
+                        self.spawn_background_snowflakes(random.randint(5, 10), speed_multiplier=5.0)
                         self.background_spawn_delay = 1
                     else:
                         self.background_spawn_delay -= 1
             else:
                 # Normal spawning before fadeout
                 if self.background_spawn_delay <= 0:
-                    for _ in range(random.randint(3, 6)):
-                        self.spawn_background_snowflake()
+                    self.spawn_background_snowflakes(random.randint(3, 6))
                     self.background_spawn_delay = 2
                 else:
                     self.background_spawn_delay -= 1
@@ -365,8 +463,8 @@ class MoreSnowIterator(BaseEffectIterator[MoreSnowConfig]):
         # Check background snow landing
         self.check_background_snow_landing()
 
-        # End when spawning stopped and all background snow is gone
-        if self.spawn_stopped and len(self.background_snow) == 0:
+        # End when spawning stopped and all background snow has landed
+        if self.spawn_stopped and not self._falling_snow:
             raise StopIteration
 
         # Keep animation running